@@ -3,6 +3,7 @@ Define interfaces to interact with the nodes in the constellation being tested
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
 from typing import Any, cast, final
 
@@ -185,10 +186,10 @@ class AbstractAccountManager(AccountManager):
         when the Node is provisioned.
         """
         self._accounts_allocated_to_role : dict[str | None, Account] = { account.role : account for account in initial_accounts if account.role }
-        self._accounts_not_allocated_to_role : list[Account] = [ account for account in initial_accounts if not account.role ]
+        self._accounts_not_allocated_to_role : deque[Account] = deque( account for account in initial_accounts if not account.role )
 
         self._non_existing_accounts_allocated_to_role : dict[str | None, NonExistingAccount] = { non_account.role : non_account for non_account in initial_non_existing_accounts if non_account.role }
-        self._non_existing_accounts_not_allocated_to_role : list[NonExistingAccount ]= [ non_account for non_account in initial_non_existing_accounts if not non_account.role ]
+        self._non_existing_accounts_not_allocated_to_role : deque[NonExistingAccount] = deque( non_account for non_account in initial_non_existing_accounts if not non_account.role )
 
         self._node : Node | None = None # the Node this AccountManager belongs to. Set once the Node has been instantiated
 
@@ -219,7 +220,7 @@ class AbstractAccountManager(AccountManager):
         ret = self._accounts_allocated_to_role.get(role)
         if not ret:
             if self._accounts_not_allocated_to_role:
-                ret = self._accounts_not_allocated_to_role.pop(0)
+                ret = self._accounts_not_allocated_to_role.popleft()
                 self._accounts_allocated_to_role[role] = ret
             else:
                 ret = self._provision_account_for_role(role)
@@ -242,7 +243,7 @@ class AbstractAccountManager(AccountManager):
         ret = self._non_existing_accounts_allocated_to_role.get(role)
         if not ret:
             if self._non_existing_accounts_not_allocated_to_role:
-                ret = self._non_existing_accounts_not_allocated_to_role.pop(0)
+                ret = self._non_existing_accounts_not_allocated_to_role.popleft()
                 self._non_existing_accounts_allocated_to_role[role] = ret
             else:
                 ret = self._provision_non_existing_account_for_role(role)
@@ -2,21 +2,35 @@
 An in-process Node implementation for now.
 """
 
-import httpx
+from __future__ import annotations
+
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import TYPE_CHECKING
+
 from multidict import MultiDict
 
-from feditest.nodedrivers import AccountManager, Node, NodeConfiguration, NodeDriver, HOSTNAME_PAR
+from feditest.nodedrivers import (
+    HOSTNAME_PAR,
+    AccountManager,
+    Node,
+    NodeConfiguration,
+    NodeDriver,
+)
 from feditest.protocols.web.diag import (
     HttpRequest,
     HttpRequestResponsePair,
     HttpResponse,
-    WebDiagClient
+    WebDiagClient,
 )
 from feditest.protocols.webfinger.abstract import AbstractWebFingerDiagClient
 from feditest.reporting import trace
 from feditest.testplan import TestPlanConstellationNode, TestPlanNodeParameter
 from feditest.utils import FEDITEST_VERSION
 
+if TYPE_CHECKING:
+    import httpx  # imported when first needed, as it takes a while to load
+
 _HEADERS = {
     "User-Agent": f"feditest/{ FEDITEST_VERSION }",
     "Origin": "https://test.example" # to trigger CORS headers in response
@@ -26,15 +40,34 @@ class Imp(AbstractWebFingerDiagClient):
     """
     In-process diagnostic WebFinger client.
     """
+    def __init__(self, rolename: str, config: NodeConfiguration, account_manager: AccountManager | None = None):
+        super().__init__(rolename, config, account_manager)
+        # Keep the httpx Clients around, so connections to the same server get reused. httpx wants
+        # the verify setting when the Client is created, so we have one per value of verify.
+        self._httpx_clients : dict[bool, httpx.Client] = {}
+        self._httpx_clients_lock = Lock() # http() may be invoked from several threads at the same time
+
+
     # Python 3.12 @override
     def http(self, request: HttpRequest, follow_redirects: bool = True, verify=False) -> HttpRequestResponsePair:
         trace( f'Performing HTTP { request.method } on { request.parsed_uri.uri }')
 
-        httpx_response = None
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        httpx_client = self._httpx_clients.get(verify)
+        if httpx_client is None:
+            with self._httpx_clients_lock:
+                httpx_client = self._httpx_clients.get(verify)
+                if httpx_client is None:
+                    httpx_client = httpx.Client(verify=verify)
+                    # Never store cookies: the Client outlives the request, and a diagnostic client must not
+                    # send back cookies from earlier requests, tests or redirect hops
+                    httpx_client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                    self._httpx_clients[verify] = httpx_client
+
         # Do not follow redirects automatically, we need to know whether there are any
-        with httpx.Client(verify=verify, follow_redirects=follow_redirects) as httpx_client:
-            httpx_request = httpx.Request(request.method, request.parsed_uri.uri, headers=_HEADERS) # FIXME more arguments
-            httpx_response = httpx_client.send(httpx_request)
+        httpx_request = httpx.Request(request.method, request.parsed_uri.uri, headers=_HEADERS) # FIXME more arguments
+        httpx_response = httpx_client.send(httpx_request, follow_redirects=follow_redirects)
 
 # FIXME: catch Tls exception and raise WebDiagClient.TlsError
 
@@ -48,6 +81,16 @@ class Imp(AbstractWebFingerDiagClient):
         raise WebDiagClient.HttpUnsuccessfulError(request)
 
 
+    def close_http_clients(self) -> None:
+        """
+        Close the connections kept open to the servers this Imp has talked to.
+        """
+        with self._httpx_clients_lock:
+            for httpx_client in self._httpx_clients.values():
+                httpx_client.close()
+            self._httpx_clients.clear()
+
+
     # Python 3.12 @override
     def add_cert_to_trust_store(self, root_cert: str) -> None:
         """
@@ -91,4 +134,5 @@ class ImpInProcessNodeDriver(NodeDriver):
 
     # Python 3.12 @override
     def _unprovision_node(self, node: Node) -> None:
-        pass
+        if isinstance(node, Imp):
+            node.close_http_clients()
@@ -2,8 +2,11 @@
 WebClient and WebServer, augmented with diagnostic functionality, that may be implemented by diagnostic Nodes.
 """
 
+from bisect import bisect_left, insort
 from datetime import UTC, date, datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import re
+import sys
 from multidict import MultiDict
 from typing import Any, Callable, List, final
 
@@ -11,8 +14,18 @@ from . import WebClient, WebServer
 from feditest.nodedrivers import NotImplementedByNodeError
 from feditest.utils import ParsedUri
 
+# Header names we look up in HttpResponse.response_headers
+_CONTENT_TYPE_HEADER = sys.intern('content-type')
+_LOCATION_HEADER = sys.intern('location')
 
-@dataclass
+# The charset parameter of a Content-Type header value, per RFC 9110
+_CHARSET_REGEX = re.compile(r';\s*charset="?([^";\s]+)"?', re.IGNORECASE)
+
+# Lookup table indexed by HTTP status code: non-zero if the status is a redirect
+_REDIRECT_HTTP_STATUSES = bytes(1 if status in (301, 302, 303, 307, 308) else 0 for status in range(600))
+
+
+@dataclass(slots=True)
 class HttpRequest:
     """
     Captures an HTTP request.
@@ -22,30 +35,41 @@ class HttpRequest:
     accept_header : str | None = None
     payload : bytes | None = None
     content_type : str | None = None
-    when_started: datetime = datetime.now(UTC) # Always need one so we can compare in the WebServerLog
+    when_started: datetime = field(default_factory=lambda: datetime.now(UTC)) # Always need one so we can compare in the WebServerLog
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpResponse:
     """
     Captures the response of an HTTP request.
     """
     http_status : int
-    response_headers: MultiDict # keys are lowercased
+    response_headers: MultiDict # keys are lowercased upon construction
     payload : bytes | None = None
-    when_completed: date | None = datetime.now(UTC)
+    when_completed: date | None = field(default_factory=lambda: datetime.now(UTC))
+    _content_type : str | None = field(init=False, repr=False, compare=False)
+    _payload_charset : str | None = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self):
+        # Lowercase and intern the header names, so lookups with the constants above compare by identity
+        # no matter how the producer spelled them
+        self.response_headers = MultiDict(( sys.intern(key.lower()), value ) for key, value in self.response_headers.items())
+
+        # The headers don't change after construction, so we determine these only once
+        self._content_type = self.response_headers.get(_CONTENT_TYPE_HEADER)
+        self._payload_charset = None
+        if self._content_type:
+            if match := _CHARSET_REGEX.search(self._content_type):
+                self._payload_charset = match[1]
 
 
     def content_type(self):
-        return self.response_headers.get('content-type')
+        return self._content_type
 
 
     def payload_charset(self):
-        content_type = self.content_type()
-        tag = 'charset='
-        if content_type and content_type.find(tag) >= 0:
-            return content_type[ content_type.find(tag)+len(tag) : ]
-        return None
+        return self._payload_charset
 
 
     def payload_as_string(self):
@@ -58,31 +82,36 @@ class HttpResponse:
 
 
     def location(self):
-        return self.response_headers.get('location')
+        return self.response_headers.get(_LOCATION_HEADER)
 
 
     def is_redirect(self):
-        return self.http_status in [301, 302, 303, 307, 308]
+        return 0 <= self.http_status < len(_REDIRECT_HTTP_STATUSES) and _REDIRECT_HTTP_STATUSES[self.http_status] != 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpRequestResponsePair:
     request: HttpRequest # the original request, in case of redirects
     final_request: HttpRequest # this is the request that actually produced this response, in case of redirects
     response: HttpResponse | None # the response, if one was obtained
 
 
+def _when_started(entry: HttpRequestResponsePair) -> datetime:
+    return entry.request.when_started
+
+
 class WebServerLog:
     """
-    A list of logged HTTP requests to a web server.
+    A list of logged HTTP requests to a web server. The entries are kept sorted by when_started,
+    even if requests made concurrently are appended out of order.
     """
-    def __init__(self, time_started: date = datetime.now(UTC), entries: List[HttpRequestResponsePair] | None = None ):
-        self._time_started : date = time_started
-        self._web_log_entries : List[HttpRequestResponsePair] = entries or []
+    def __init__(self, time_started: date | None = None, entries: List[HttpRequestResponsePair] | None = None ):
+        self._time_started : date = time_started or datetime.now(UTC)
+        self._web_log_entries : List[HttpRequestResponsePair] = sorted(entries, key=_when_started) if entries else []
 
 
     def append(self, to_add: HttpRequestResponsePair) -> None:
-        self._web_log_entries.append(to_add)
+        insort(self._web_log_entries, to_add, key=_when_started)
 
 
     def entries(self):
@@ -90,11 +119,11 @@ class WebServerLog:
 
 
     def entries_since(self, cutoff: date) ->  'WebServerLog':
-        ret : List[HttpRequestResponsePair] = []
-        for entry in self._web_log_entries:
-            if entry.request.when_started >= cutoff :
-                ret.append(entry)
-        return WebServerLog(cutoff, ret)
+        """
+        Return a WebServerLog with only the entries that were started at or after cutoff.
+        """
+        start = bisect_left(self._web_log_entries, cutoff, key=_when_started)
+        return WebServerLog(cutoff, self._web_log_entries[start:])
 
 
 class WebDiagClient(WebClient):
@@ -136,7 +165,7 @@ class WebDiagClient(WebClient):
 
 
         def __str__(self):
-            f'Too many redirects: { self._request.uri.uri }'
+            return f'Too many redirects: { self._request.parsed_uri.uri }'
 
 
     class HttpUnsuccessfulError(RuntimeError):
@@ -152,7 +181,7 @@ class WebDiagClient(WebClient):
 
 
         def __str__(self):
-            f'Unsuccessful HTTP request: { self._request.uri.uri }'
+            return f'Unsuccessful HTTP request: { self._request.parsed_uri.uri }'
 
 
     class TlsError(RuntimeError):
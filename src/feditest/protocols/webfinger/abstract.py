@@ -2,15 +2,26 @@
 Functionality that may be shared by several WebFinger Node implementations.
 """
 
-from typing import cast
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 
 from feditest.protocols.web.diag import HttpRequest, HttpRequestResponsePair, WebDiagClient
 from feditest.protocols.webfinger import WebFingerServer
 from feditest.protocols.webfinger.diag import ClaimedJrd, WebFingerDiagClient
-from feditest.protocols.webfinger.utils import construct_webfinger_uri_for, WebFingerQueryDiagResponse
+from feditest.protocols.webfinger.utils import construct_parsed_webfinger_uri_for, WebFingerQueryDiagResponse
 from feditest.utils import ParsedUri
 
 
+# The required content type of WebFinger responses, possibly followed by parameters such as charset
+_JRD_CONTENT_TYPE = 'application/jrd+json'
+
+# Charset names under which we can hand the payload to the JSON decoder without decoding it first
+_UTF8_CHARSETS = frozenset(( 'utf-8', 'utf8' ))
+
+# How many WebFinger queries diag_perform_webfinger_queries may have in flight at the same time
+_MAX_CONCURRENT_QUERIES = 16
+
+
 class AbstractWebFingerDiagClient(WebFingerDiagClient):
     # Python 3.12 @override
     def diag_perform_webfinger_query(
@@ -20,50 +31,60 @@ class AbstractWebFingerDiagClient(WebFingerDiagClient):
         server: WebFingerServer | None = None
     ) -> WebFingerQueryDiagResponse:
 
-        query_url = construct_webfinger_uri_for(resource_uri, rels, server.hostname() if server else None )
-        parsed_uri = ParsedUri.parse(query_url)
-        if not parsed_uri:
-            raise ValueError('Not a valid URI:', query_url) # can't avoid this
+        parsed_uri = construct_parsed_webfinger_uri_for(resource_uri, rels, server.hostname() if server else None )
 
         first_request = HttpRequest(parsed_uri)
         current_request = first_request
-        pair : HttpRequestResponsePair | None = None
-        for redirect_count in range(10, 0, -1):
-            pair = self.http(current_request)
-            if pair.response and pair.response.is_redirect():
-                if redirect_count <= 0:
-                    return WebFingerQueryDiagResponse(pair, None, [ WebDiagClient.TooManyRedirectsError(current_request) ])
-                parsed_location_uri = ParsedUri.parse(pair.response.location())
-                if not parsed_location_uri:
-                    return WebFingerQueryDiagResponse(pair, None, [ ValueError('Location header is not a valid URI:', query_url, '(from', resource_uri, ')') ] )
-                current_request = HttpRequest(parsed_location_uri)
-            break
-
-        # I guess we always have a non-null responses here, but mypy complains without the cast
-        pair = cast(HttpRequestResponsePair, pair)
-        ret_pair = HttpRequestResponsePair(first_request, current_request, pair.response)
-        if ret_pair.response is None:
+        # We follow redirects ourselves, so we can report on them
+        pair = self.http(current_request, follow_redirects=False)
+        redirects_left = 10
+        while pair.response and pair.response.is_redirect():
+            if redirects_left <= 0:
+                return WebFingerQueryDiagResponse(pair, None, [ WebDiagClient.TooManyRedirectsError(first_request) ])
+            redirects_left -= 1
+
+            location = pair.response.location()
+            parsed_location_uri = ParsedUri.parse(urljoin(current_request.parsed_uri.uri, location)) if location else None
+            if not parsed_location_uri:
+                return WebFingerQueryDiagResponse(pair, None, [ ValueError('Location header is not a valid URI:', location, '(from', resource_uri, ')') ] )
+            current_request = HttpRequest(parsed_location_uri)
+            pair = self.http(current_request, follow_redirects=False)
+
+        response = pair.response
+        if response is None:
             raise RuntimeError('Unexpected None HTTP response')
+        ret_pair = HttpRequestResponsePair(first_request, current_request, response)
 
         excs : list[Exception] = []
-        if ret_pair.response.http_status != 200:
+        http_status_ok = response.http_status == 200
+        if not http_status_ok:
             excs.append(WebFingerDiagClient.WrongHttpStatusError(ret_pair))
 
-        content_type = ret_pair.response.content_type()
-        if (content_type is None or (content_type != "application/jrd+json"
-            and not content_type.startswith( "application/jrd+json;" ))
+        content_type = response.content_type()
+        if (content_type is None or not content_type.startswith(_JRD_CONTENT_TYPE)
+            or (len(content_type) > len(_JRD_CONTENT_TYPE) and content_type[len(_JRD_CONTENT_TYPE)] != ';')
         ):
             excs.append(WebFingerDiagClient.WrongContentTypeError(ret_pair))
 
+        if not http_status_ok:
+            # Whatever the body is, it isn't the JRD we asked for, so parsing it would only add noise
+            return WebFingerQueryDiagResponse(ret_pair, None, excs)
+
         jrd : ClaimedJrd | None = None
 
-        if ret_pair.response.payload is None:
+        payload = response.payload
+        if payload is None:
             raise RuntimeError('Unexpected None payload in HTTP response')
 
         try:
-            json_string = ret_pair.response.payload.decode(encoding=ret_pair.response.payload_charset() or "utf8")
+            charset = response.payload_charset()
+            if charset is None or charset.lower() in _UTF8_CHARSETS:
+                # The JSON decoder reads UTF-8 bytes directly, no need to make a str copy first
+                json_string : str | bytes = payload
+            else:
+                json_string = payload.decode(encoding=charset)
 
-            jrd = ClaimedJrd(json_string) # May throw JSONDecodeError
+            jrd = ClaimedJrd(json_string) # May throw msgspec.DecodeError
             jrd.validate() # May throw JrdError
         except ExceptionGroup as exc:
             excs += exc.exceptions
@@ -71,3 +92,21 @@ class AbstractWebFingerDiagClient(WebFingerDiagClient):
             excs.append(exc)
 
         return WebFingerQueryDiagResponse(ret_pair, jrd, excs)
+
+
+    def diag_perform_webfinger_queries(
+        self,
+        resources: list[tuple[str, list[str] | None]],
+        server: WebFingerServer | None = None
+    ) -> list[WebFingerQueryDiagResponse]:
+        """
+        Perform several WebFinger queries concurrently, instead of waiting for each in turn.
+        resources: the resource URIs to query, each with the rels to ask for, if any
+        server: if given, query this WebFingerServer instead of the one determined from each resource URI
+        return: the responses, in the same sequence as the resources
+        """
+        if len(resources) <= 1:
+            return [ self.diag_perform_webfinger_query(resource_uri, rels, server) for resource_uri, rels in resources ]
+
+        with ThreadPoolExecutor(max_workers=min(len(resources), _MAX_CONCURRENT_QUERIES)) as executor:
+            return list(executor.map(lambda resource: self.diag_perform_webfinger_query(resource[0], resource[1], server), resources))
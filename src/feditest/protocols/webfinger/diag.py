@@ -1,10 +1,14 @@
 """
 """
 
+from collections.abc import Callable
 import json
 from dataclasses import dataclass, field
+import re
 from typing import Any
 
+import msgspec
+
 from feditest.nodedrivers import NotImplementedByNodeError
 from feditest.protocols.web.diag import HttpRequestResponsePair, WebDiagClient
 from . import WebFingerClient, WebFingerServer
@@ -16,115 +20,11 @@ from feditest.utils import (
 )
 
 
-class ClaimedJrd:
-    """
-    The JSON structure that claims to be a JRD. This can contain any JSON because it needs to hold whatever
-    claims to be a JRD, even if it is invalid. It won't try to hold data that isn't valid JSON.
-    """
-    def __init__(self, json_string: str):
-        if json_string is None or not isinstance(json_string, (str, bytes)):
-            raise RuntimeError(f"Invalid payload type: {type(json_string)}")
-        self._json = json.loads(json_string)
-
-
-    class JrdError(RuntimeError):
-        """
-        Represents a problem during JRD parsing, such as syntax error.
-        """
-        def __init__(self, jrd: 'ClaimedJrd', msg: str):
-            self._jrd = jrd
-            self._msg = msg
-
-
-        def __str__(self):
-            return self._msg or self.__class__.__name__
-
-
-    class InvalidTypeError(JrdError):
-        """
-        The JSON structure is invalid for a Jrd.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class InvalidUriError(JrdError):
-        """
-        The URI in a Jrd is invalid.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class InvalidValueError(JrdError):
-        """
-        A value in a Jrd is None or invalid.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class MissingMemberError(JrdError):
-        """
-        The JRD is missing a member that is required.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class InvalidRelError(JrdError):
-        """
-        The JRD specifies a link relationship that is invalid.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class InvalidMediaTypeError(JrdError):
-        """
-        The JRD specifies a media type that is invalid.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    class InvalidLanguageTagError(JrdError):
-        """
-        The JRD specifies a language tag that is invalid.
-        """
-        pass # pylint: disable=unnecessary-pass
-
-
-    def subject(self) -> str | None: # optional in WebFinger
-        return self._json.get('subject')
-
-
-    def aliases(self) -> list[str] | None:
-        return self._json.get('aliases')
-
-
-    def properties(self) -> dict[str, str | None] | None:
-        return self._json['properties']
-
+# type/subtype per RFC 6838, section 4.2, optionally followed by parameters
+_MEDIA_TYPE_REGEX = re.compile(r'[A-Za-z0-9][A-Za-z0-9!#$&^_.+-]{0,126}/[A-Za-z0-9][A-Za-z0-9!#$&^_.+-]{0,126}(\s*;.*)?')
 
-    def links(self) -> list[dict[str,Any | None]] | None :
-        return self._json['links']
-
-
-    def as_json_string(self) -> Any:
-        return json.dumps(self._json)
-
-
-    @staticmethod
-    def create_and_validate(value: str) -> 'ClaimedJrd':
-        ret = ClaimedJrd(value) # may raise JSONDecodeError
-        ret.validate()          # may raise any of the errors defined here
-        return ret
-
-
-    @staticmethod
-    def is_registered_relation_type(value: str) -> bool:
-        """
-        Return True if the provided value is a registered relation type in
-        https://www.iana.org/assignments/link-relations/link-relations.xhtml
-        """
-
-        # copy-pasted from the CSV file at https://www.iana.org/assignments/link-relations/link-relations.xhtml
-        defined = """about
+# copy-pasted from the CSV file at https://www.iana.org/assignments/link-relations/link-relations.xhtml
+_REGISTERED_RELATION_TYPES = frozenset("""about
 acl
 alternate
 amphtml
@@ -245,130 +145,189 @@ version-history
 via
 webmention
 working-copy
-working-copy-of"""
-        return value in defined.split()
+working-copy-of""".split())
+
+
+class ClaimedJrd:
+    """
+    The JSON structure that claims to be a JRD. This can contain any JSON because it needs to hold whatever
+    claims to be a JRD, even if it is invalid. It won't try to hold data that isn't valid JSON.
+    """
+    __slots__ = ('_json', '_json_string', '_known_valid')
+    _CACHE_SLOTS = ('_json_string', '_known_valid') # derived from _json on first use, not part of the value
+
+    def __init__(self, json_string: str | bytes):
+        """
+        json_string: the JSON as a str, or as UTF-8 encoded bytes
+        """
+        if json_string is None or not isinstance(json_string, (str, bytes)):
+            raise RuntimeError(f"Invalid payload type: {type(json_string)}")
+        self._json = msgspec.json.decode(json_string) # faster than json.loads; may raise msgspec.DecodeError
+        self._json_string : str | None = None # serialized on first use; _json is never modified
+        self._known_valid = False # set once validate() has passed
+
+
+    class JrdError(RuntimeError):
+        """
+        Represents a problem during JRD parsing, such as syntax error.
+        """
+        def __init__(self, jrd: 'ClaimedJrd', msg: str):
+            self._jrd = jrd
+            self._msg = msg
+
+
+        def __str__(self):
+            return self._msg or self.__class__.__name__
+
+
+    class InvalidTypeError(JrdError):
+        """
+        The JSON structure is invalid for a Jrd.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class InvalidUriError(JrdError):
+        """
+        The URI in a Jrd is invalid.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class InvalidValueError(JrdError):
+        """
+        A value in a Jrd is None or invalid.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class MissingMemberError(JrdError):
+        """
+        The JRD is missing a member that is required.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class InvalidRelError(JrdError):
+        """
+        The JRD specifies a link relationship that is invalid.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class InvalidMediaTypeError(JrdError):
+        """
+        The JRD specifies a media type that is invalid.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    class InvalidLanguageTagError(JrdError):
+        """
+        The JRD specifies a language tag that is invalid.
+        """
+        pass # pylint: disable=unnecessary-pass
+
+
+    def subject(self) -> str | None: # optional in WebFinger
+        return self._json.get('subject')
+
+
+    def aliases(self) -> list[str] | None:
+        return self._json.get('aliases')
+
+
+    def properties(self) -> dict[str, str | None] | None:
+        return self._json.get('properties')
+
+
+    def links(self) -> list[dict[str,Any | None]] | None :
+        return self._json.get('links')
+
+
+    def as_json_string(self) -> Any:
+        if self._json_string is None:
+            self._json_string = json.dumps(self._json)
+        return self._json_string
+
+
+    @staticmethod
+    def create_and_validate(value: str) -> 'ClaimedJrd':
+        ret = ClaimedJrd(value) # may raise msgspec.DecodeError
+        ret.validate()          # may raise any of the errors defined here
+        return ret
+
+
+    @staticmethod
+    def is_valid(value: str | bytes) -> bool:
+        """
+        Return True if the provided value is a valid JRD. Stops at the first problem found,
+        so use create_and_validate instead to find out about all of them.
+        """
+        try:
+            ClaimedJrd(value).validate(stop_at_first_error=True)
+            return True
+        except (msgspec.DecodeError, ClaimedJrd.JrdError):
+            return False
+
+
+    @staticmethod
+    def is_registered_relation_type(value: str) -> bool:
+        """
+        Return True if the provided value is a registered relation type in
+        https://www.iana.org/assignments/link-relations/link-relations.xhtml
+        """
+        return value in _REGISTERED_RELATION_TYPES
 
     @staticmethod
     def is_valid_media_type(value: str) -> bool:
         """
-        This should check for a valid media type per RFC 6838.
-        FIXME
+        Return True if the provided value is a valid media type per RFC 6838. Parameters, if any,
+        are not checked.
         """
-        return value.find('/') > 0
+        return _MEDIA_TYPE_REGEX.fullmatch(value) is not None
 
 
     VALID_JRD_KEYS = { "subject", "aliases", "properties", "links" }
 
 
-    def validate(self) -> None: # pylint: disable=too-many-branches,too-many-statements
+    def validate(self, stop_at_first_error: bool = False) -> None:
         """
         Validate the correctness of the JRD. Throws a single Exceptions if it is not valid. This Exception
         may be an ExceptionGroup in case there is more than one error.
+        stop_at_first_error: if True, raise the first error found without checking the rest
         """
-        excs : list[Exception] = []
-        if not isinstance(self._json, dict):
-            raise ClaimedJrd.InvalidTypeError(self, 'Must be a JSON object') # can't continue otherwise
-
-        for key in self._json:
-            if key not in self.VALID_JRD_KEYS:
-                excs.append(ClaimedJrd.JrdError(self, f"Invalid key: {key}"))
-
-        if 'subject' in self._json:
-            # is optional
+        # _json never changes, so once valid, always valid. Failures are not remembered: each caller
+        # gets its own, freshly raised exceptions.
+        if self._known_valid:
+            return
+        self._validate(stop_at_first_error)
+        self._known_valid = True
 
-            if not isinstance(self._json['subject'], str):
-                excs.append(ClaimedJrd.InvalidTypeError(self, 'Subject not a string'))
-            elif http_https_acct_uri_parse_validate(self._json['subject']) is None:
-                excs.append(ClaimedJrd.InvalidUriError(self, 'Subject not absolute URI: "' + f"{ self._json['subject'] }" + '"'))
 
+    def _validate(self, stop_at_first_error: bool) -> None:
+        """
+        Does the work for validate(), without caching the outcome.
+        """
+        excs : list[Exception] = []
 
-        if 'aliases' in self._json:
-            # is optional
+        def report(exc: Exception) -> None:
+            if stop_at_first_error:
+                raise exc
+            excs.append(exc)
 
-            if not isinstance(self._json['aliases'], list):
-                excs.append(ClaimedJrd.InvalidTypeError(self, 'Aliases not a JSON array'))
-            else:
-                for alias in self._json['aliases'] :
-                    if not isinstance(alias, str):
-                        excs.append(ClaimedJrd.InvalidTypeError(self, 'Alias not a string'))
-                    elif http_https_acct_uri_parse_validate(alias) is None:
-                        excs.append(ClaimedJrd.InvalidUriError(self, f'Alias not absolute URI: "{ alias }"'))
+        data = self._json
+        if not isinstance(data, dict):
+            raise ClaimedJrd.InvalidTypeError(self, 'Must be a JSON object') # can't continue otherwise
 
-        if 'properties' in self._json:
-            # is optional
+        for key in data:
+            if key not in self.VALID_JRD_KEYS:
+                report(ClaimedJrd.JrdError(self, f"Invalid key: {key}"))
 
-            if not isinstance(self._json['properties'], dict):
-                excs.append(ClaimedJrd.InvalidTypeError(self, 'Properties not a JSON object'))
-            else:
-                for key, value in self._json['properties'].items():
-                    if not isinstance(key, str):
-                        excs.append(ClaimedJrd.InvalidTypeError(self, 'Property name not a string'))
-                    elif http_https_acct_uri_parse_validate(key) is None:
-                        excs.append(ClaimedJrd.InvalidUriError(self, f'Property name not an absolute URI: "{ key }"'))
-                    elif value is not None and not isinstance(value, str):
-                        excs.append(ClaimedJrd.InvalidTypeError(self, f'Property value not string or null: key "{ key }"'))
-
-        if 'links' in self._json:
-            # is optional
-
-            if not isinstance(self._json['links'], list):
-                excs.append(ClaimedJrd.InvalidTypeError(self, 'Links not a JSON array'))
-            else:
-                for link in self._json['links']:
-                    if not isinstance(link, dict):
-                        excs.append(ClaimedJrd.InvalidTypeError(self, 'Link not a JSON object'))
-                    elif 'rel' not in link:
-                        excs.append(ClaimedJrd.MissingMemberError(self, 'Link missing rel property'))
-                    elif not isinstance(link['rel'], str):
-                        excs.append(ClaimedJrd.InvalidTypeError(self, 'Link rel value not a string'))
-                    elif http_https_acct_uri_parse_validate(link['rel']) is None and not ClaimedJrd.is_registered_relation_type(link['rel']):
-                        excs.append(ClaimedJrd.InvalidRelError(self, 'Link rel value not absolute URI nor registered relation type: "' + f"{link['rel']}" + '"'))
-
-                    if 'type' in link:
-                        # is optional
-
-                        if not isinstance(link['type'], str):
-                            excs.append(ClaimedJrd.InvalidTypeError(self, 'Link type not a string'))
-                        elif not ClaimedJrd.is_valid_media_type(link['type']):
-                            excs.append(ClaimedJrd.InvalidMediaTypeError(self, 'Link type not a valid media type: "' + f"{ link['type'] }" + '"'))
-
-                    if 'href' in link:
-                        # is optional
-
-                        if not isinstance(link['href'], str):
-                            excs.append(ClaimedJrd.InvalidTypeError(self, 'Link href not a string'))
-                        elif uri_parse_validate(link['href']) is None:
-                            excs.append( ClaimedJrd.InvalidUriError(self, 'Link href not a URI: "' + f"{ link['href']}" + '"'))
-
-                    if 'titles' in link:
-                        # is optional
-
-                        if not isinstance(link['titles'], dict):
-                            excs.append(ClaimedJrd.InvalidTypeError(self, 'Link titles not a JSON Object'))
-                        else:
-                            for key, value in link['titles']:
-                                if not isinstance(key,str):
-                                    excs.append(ClaimedJrd.InvalidTypeError(self, 'Link title name not a string'))
-                                elif key != 'und' and rfc5646_language_tag_parse_validate(key) is None:
-                                    excs.append(ClaimedJrd.InvalidLanguageTagError(self, f'Link title name not a valid language tag or "und": "{ key }"'))
-
-                                if not value or not isinstance(value, str):
-                                    excs.append(ClaimedJrd.InvalidValueError(self, 'Link title value not a non-null string: name "{ key }"'))
-
-                    if 'properties' in link:
-                        # is optional
-
-                        if not isinstance(link['properties'], dict):
-                            excs.append(ClaimedJrd.InvalidTypeError(self, 'Link properties not a JSON object'))
-                        else:
-                            for key, value in link['properties'].items():
-                                if not isinstance(key, str):
-                                    excs.append(ClaimedJrd.InvalidTypeError(self, 'Link property name not a string'))
-                                elif http_https_acct_uri_parse_validate(key) is None:
-                                    excs.append(ClaimedJrd.InvalidUriError(self, 'Link property name not absolute URI: "{ key }"'))
-
-                                if value is not None and not isinstance(value, str):
-                                    excs.append(ClaimedJrd.InvalidTypeError(self, 'Link property value not a string nor null. Key "{ key }"'))
+        # all members are optional
+        for key, validate_member in ClaimedJrd._MEMBER_VALIDATORS:
+            if key in data:
+                validate_member(self, data[key], report)
 
         if excs:
             if len(excs) == 1:
@@ -377,100 +336,163 @@ working-copy-of"""
                 raise ExceptionGroup('JRD has multiple errors', excs)
 
 
-    def is_valid_link_subset(self, jrd_with_superset : 'ClaimedJrd', rels: list[str] | None = None) -> bool:
-        """
-        Returns true if this and the provided ClaimedJrd are identical, except that the provided jrd_with_superset
-        may contain additional 'link' entries as long as they don't have a 'rel' value in set rels.
-        """
-        super_links = jrd_with_superset.links()
-        sub_links = self.links()
+    def _validate_subject(self, subject: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(subject, str):
+            report(ClaimedJrd.InvalidTypeError(self, 'Subject not a string'))
+        elif http_https_acct_uri_parse_validate(subject) is None:
+            report(ClaimedJrd.InvalidUriError(self, f'Subject not absolute URI: "{ subject }"'))
 
-        if super_links:
-            if sub_links:
-                if len(sub_links) > len(super_links):
-                    return False
 
-                super_position = 0
-                for sub_link in sub_links:
-                    found = False
-                    for super_i in range(super_position, len(super_links)):
-                        super_link = super_links[super_i]
-                        if self._element_equals(super_link, sub_link):
-                            super_position = super_i + 1
-                            found = True
-                            break
-                        if super_link['rel'] in sub_links:
-                            # should not have removed this one
-                            return False
-                    if not found:
-                        return False
+    def _validate_aliases(self, aliases: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(aliases, list):
+            report(ClaimedJrd.InvalidTypeError(self, 'Aliases not a JSON array'))
+            return
 
-            return True # sub has none
+        for alias in aliases :
+            if not isinstance(alias, str):
+                report(ClaimedJrd.InvalidTypeError(self, 'Alias not a string'))
+            elif http_https_acct_uri_parse_validate(alias) is None:
+                report(ClaimedJrd.InvalidUriError(self, f'Alias not absolute URI: "{ alias }"'))
 
-        if sub_links:
-            return False # super has none
-        return True # neither has any
 
+    def _validate_properties(self, properties: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(properties, dict):
+            report(ClaimedJrd.InvalidTypeError(self, 'Properties not a JSON object'))
+            return
 
-    def _element_equals(self, a: dict[str, Any], b: dict[str, Any]) -> bool: # pylint: disable=too-many-return-statements
-        """
-        Helper to compare two link elements for equality.
-        """
-        if len(a) != len(b):
-            return False
+        for key, value in properties.items():
+            if not isinstance(key, str):
+                report(ClaimedJrd.InvalidTypeError(self, 'Property name not a string'))
+            elif http_https_acct_uri_parse_validate(key) is None:
+                report(ClaimedJrd.InvalidUriError(self, f'Property name not an absolute URI: "{ key }"'))
+            elif value is not None and not isinstance(value, str):
+                report(ClaimedJrd.InvalidTypeError(self, f'Property value not string or null: key "{ key }"'))
 
-        if a.get('rel') != b.get('rel'):
-            return False
 
-        if a.get('type') != b.get('type'):
-            return False
+    def _validate_links(self, links: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(links, list):
+            report(ClaimedJrd.InvalidTypeError(self, 'Links not a JSON array'))
+            return
 
-        if a.get('href') != b.get('href'):
-            return False
+        for link in links:
+            if not isinstance(link, dict):
+                report(ClaimedJrd.InvalidTypeError(self, 'Link not a JSON object'))
+                continue # can't check the members of something that isn't an object
 
-        if not self._dict_equals(a.get('titles'), b.get('titles')):
-            return False
+            if 'rel' not in link:
+                report(ClaimedJrd.MissingMemberError(self, 'Link missing rel property'))
+
+            # all members other than rel are optional
+            for key, validate_link_member in ClaimedJrd._LINK_MEMBER_VALIDATORS:
+                if key in link:
+                    validate_link_member(self, link[key], report)
+
+
+    def _validate_link_rel(self, rel: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(rel, str):
+            report(ClaimedJrd.InvalidTypeError(self, 'Link rel value not a string'))
+        elif rel not in _REGISTERED_RELATION_TYPES and http_https_acct_uri_parse_validate(rel) is None: # set lookup first, it's cheaper
+            report(ClaimedJrd.InvalidRelError(self, f'Link rel value not absolute URI nor registered relation type: "{ rel }"'))
+
+
+    def _validate_link_type(self, link_type: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(link_type, str):
+            report(ClaimedJrd.InvalidTypeError(self, 'Link type not a string'))
+        elif not ClaimedJrd.is_valid_media_type(link_type):
+            report(ClaimedJrd.InvalidMediaTypeError(self, f'Link type not a valid media type: "{ link_type }"'))
 
-        if not self._dict_equals(a.get('properties'), b.get('properties')):
-            return False
 
-        return True
+    def _validate_link_href(self, href: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(href, str):
+            report(ClaimedJrd.InvalidTypeError(self, 'Link href not a string'))
+        elif uri_parse_validate(href) is None:
+            report(ClaimedJrd.InvalidUriError(self, f'Link href not a URI: "{ href }"'))
 
 
-    def _dict_equals(self, a: dict[str,Any] | None, b: dict[str,Any] | None) -> bool: # pylint: disable=too-many-return-statements
+    def _validate_link_titles(self, titles: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(titles, dict):
+            report(ClaimedJrd.InvalidTypeError(self, 'Link titles not a JSON Object'))
+            return
+
+        for key, value in titles.items():
+            if not isinstance(key,str):
+                report(ClaimedJrd.InvalidTypeError(self, 'Link title name not a string'))
+            elif key != 'und' and rfc5646_language_tag_parse_validate(key) is None:
+                report(ClaimedJrd.InvalidLanguageTagError(self, f'Link title name not a valid language tag or "und": "{ key }"'))
+
+            if not value or not isinstance(value, str):
+                report(ClaimedJrd.InvalidValueError(self, f'Link title value not a non-null string: name "{ key }"'))
+
+
+    def _validate_link_properties(self, link_properties: Any, report: Callable[[Exception], None]) -> None:
+        if not isinstance(link_properties, dict):
+            report(ClaimedJrd.InvalidTypeError(self, 'Link properties not a JSON object'))
+            return
+
+        for key, value in link_properties.items():
+            if not isinstance(key, str):
+                report(ClaimedJrd.InvalidTypeError(self, 'Link property name not a string'))
+            elif http_https_acct_uri_parse_validate(key) is None:
+                report(ClaimedJrd.InvalidUriError(self, f'Link property name not absolute URI: "{ key }"'))
+
+            if value is not None and not isinstance(value, str):
+                report(ClaimedJrd.InvalidTypeError(self, f'Link property value not a string nor null. Key "{ key }"'))
+
+
+    # Which method validates which member, in the sequence in which they are checked
+    _MEMBER_VALIDATORS = (
+        ( 'subject',    _validate_subject ),
+        ( 'aliases',    _validate_aliases ),
+        ( 'properties', _validate_properties ),
+        ( 'links',      _validate_links )
+    )
+    _LINK_MEMBER_VALIDATORS = (
+        ( 'rel',        _validate_link_rel ),
+        ( 'type',       _validate_link_type ),
+        ( 'href',       _validate_link_href ),
+        ( 'titles',     _validate_link_titles ),
+        ( 'properties', _validate_link_properties )
+    )
+
+
+    def is_valid_link_subset(self, jrd_with_superset : 'ClaimedJrd', rels: list[str] | None = None) -> bool:
         """
-        Helper to compare two dicts for equality.
+        Returns true if this and the provided ClaimedJrd are identical, except that the provided jrd_with_superset
+        may contain additional 'link' entries as long as they don't have a 'rel' value in set rels.
         """
-        if a is None:
-            if b is None:
-                return True
-            return False
+        super_links = jrd_with_superset.links() or []
+        sub_links = self.links() or []
 
-        if b is None:
+        # Neither JRD has necessarily been validated
+        if not isinstance(super_links, list) or not isinstance(sub_links, list):
             return False
 
-        if len(a) != len(b):
+        if len(sub_links) > len(super_links):
             return False
 
-        for a_key, a_value in a.items():
-            if a_key in b:
-                b_value = b[a_key]
-                if a_value != b_value:
-                    return False
-            else:
-                return False
+        kept_rels = frozenset(rels) if rels else frozenset()
+
+        # Links keep their order in the subset, so a single pass over both lists decides it
+        sub_position = 0
+        for super_link in super_links:
+            if sub_position < len(sub_links) and super_link == sub_links[sub_position]: # plain JSON values, so == compares them fully
+                sub_position += 1
+            elif isinstance(super_link, dict): # if not, it can't have a rel, so it may be dropped
+                rel = super_link.get('rel')
+                if isinstance(rel, str) and rel in kept_rels: # rel could be anything, too
+                    return False # should not have removed this one
 
-        return True
+        return sub_position == len(sub_links)
 
 
     def __str__(self):
         """
         For error messages.
         """
-        return json.dumps(self._json)
+        return self.as_json_string()
 
 
-@dataclass
+@dataclass(slots=True)
 class WebFingerQueryDiagResponse:
     http_request_response_pair: HttpRequestResponsePair
     jrd : ClaimedJrd | None # This may be an invalid jrd
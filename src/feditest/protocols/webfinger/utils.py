@@ -2,7 +2,9 @@
 WebFinger testing utils
 """
 
-from urllib.parse import quote, urlparse
+from functools import lru_cache
+import re
+from urllib.parse import quote
 from typing import Any, Type, cast
 
 from multidict import MultiDict
@@ -10,6 +12,18 @@ from hamcrest.core.base_matcher import BaseMatcher
 from hamcrest.core.description import Description
 
 from .diag import ClaimedJrd, WebFingerQueryDiagResponse
+from feditest.utils import ParsedNonAcctUri
+
+
+# Where the host part of a resource URI ends
+_HOST_END_REGEX = re.compile('[/?#]')
+
+# The fixed parts of every WebFinger URI
+_WEBFINGER_PATH = '/.well-known/webfinger'
+_RESOURCE_PREFIX = 'resource='
+
+# Precedes each requested rel in the WebFinger URI
+_REL_SEPARATOR = '&rel='
 
 
 class UnsupportedUriSchemeError(RuntimeError):
@@ -35,21 +49,64 @@ def construct_webfinger_uri_for(
 ) -> str:
     """
     Helper method to construct the WebFinger URI from a resource URI, an optional list
-    of rels to ask for, and (if given) a non-default hostname
+    of rels to ask for, and (if given) a non-default hostname. Duplicate rels are only
+    asked for once.
     """
-    if not hostname:
-        parsed_resource_uri = urlparse(resource_uri)
-        match parsed_resource_uri.scheme:
-            case "acct":
-                _, hostname = parsed_resource_uri.path.split(
-                    "@", maxsplit=1
-                )  # 1: number of splits, not number of elements
+    return _construct_parsed_webfinger_uri_for(resource_uri, tuple(dict.fromkeys(rels)) if rels else None, hostname).uri
+
 
-            case 'http':
-                hostname = parsed_resource_uri.netloc
+def construct_parsed_webfinger_uri_for(
+    resource_uri: str,
+    rels: list[str] | None = None,
+    hostname: str | None = None
+) -> ParsedNonAcctUri:
+    """
+    Same as construct_webfinger_uri_for, but returns the WebFinger URI already parsed, so
+    callers that need a ParsedUri don't have to parse the string again.
+    """
+    return _construct_parsed_webfinger_uri_for(resource_uri, tuple(dict.fromkeys(rels)) if rels else None, hostname)
 
-            case 'https':
-                hostname = parsed_resource_uri.netloc
+
+def construct_webfinger_uris_for(
+    resource_uris: list[str],
+    rels: list[str] | None = None,
+    hostname: str | None = None
+) -> list[str]:
+    """
+    Same as construct_webfinger_uri_for, but for many resource URIs at once. The same rels and hostname
+    apply to all of them.
+    """
+    rels_tuple = tuple(dict.fromkeys(rels)) if rels else None
+    return [ _construct_parsed_webfinger_uri_for(resource_uri, rels_tuple, hostname).uri for resource_uri in resource_uris ]
+
+
+@lru_cache(maxsize=4096)
+def _construct_parsed_webfinger_uri_for(
+    resource_uri: str,
+    rels: tuple[str, ...] | None,
+    hostname: str | None
+) -> ParsedNonAcctUri:
+    """
+    Cached implementation of construct_webfinger_uri_for and construct_parsed_webfinger_uri_for. rels is a
+    tuple, so it can be part of the cache key.
+    """
+    if not hostname:
+        # We only need the host, so we don't run a full urlparse
+        scheme, sep, rest = resource_uri.partition(':')
+        if not sep:
+            raise UnsupportedUriSchemeError(resource_uri)
+        match scheme.lower():
+            case 'acct':
+                _, sep, hostname = rest.rpartition('@')
+                if sep:
+                    hostname = _HOST_END_REGEX.split(hostname, maxsplit=1)[0]
+                else:
+                    hostname = None
+
+            case 'http' | 'https':
+                if rest.startswith('//'):
+                    authority = _HOST_END_REGEX.split(rest[2:], maxsplit=1)[0]
+                    hostname = authority.rpartition('@')[2] # without userinfo, if any
 
             case _:
                 raise UnsupportedUriSchemeError(resource_uri)
@@ -57,12 +114,12 @@ def construct_webfinger_uri_for(
     if not hostname:
         raise CannotDetermineWebFingerHostError(resource_uri)
 
-    uri = f"https://{hostname}/.well-known/webfinger?resource={quote(resource_uri)}"
+    query = _RESOURCE_PREFIX + quote(resource_uri)
     if rels:
-        for rel in rels:
-            uri += f"&rel={ quote(rel) }"
+        query += _REL_SEPARATOR + _REL_SEPARATOR.join(quote(rel) for rel in rels)
 
-    return uri
+    # We know all the parts, so we construct the ParsedUri directly instead of parsing the assembled string
+    return ParsedNonAcctUri('https', hostname, _WEBFINGER_PATH, '', query, '')
 
 
 class RecursiveEqualToMatcher(BaseMatcher):
@@ -78,8 +135,10 @@ class RecursiveEqualToMatcher(BaseMatcher):
 
 
     def _equals(self, a: Any, b: Any):
+        if a is b:
+            return True # also covers None; shared sub-objects don't need to be walked
         if a is None:
-            return b is None
+            return False
         if b is None:
             return False
         if type(a) is not type(b):
@@ -101,6 +160,12 @@ class RecursiveEqualToMatcher(BaseMatcher):
             return True
         if hasattr(a, '__dict__') and hasattr(b, '__dict__'):
             return self._equals(a.__dict__, b.__dict__)
+        # Skip slots that only cache derived values: whether they have been filled yet doesn't make objects different
+        cache_slots = getattr(a, '_CACHE_SLOTS', ())
+        slots = [ slot for cls in type(a).__mro__ for slot in getattr(cls, '__slots__', ()) if slot not in cache_slots ]
+        if slots:
+            # same type, so same slots
+            return all(self._equals(getattr(a, slot, None), getattr(b, slot, None)) for slot in slots)
         return False # not sure what else it can be
 
 
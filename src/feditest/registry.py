@@ -9,6 +9,7 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat, load_pem_private_key
 from datetime import datetime, timedelta, UTC
+from functools import lru_cache
 import json
 import msgspec
 import os.path
@@ -21,6 +22,34 @@ from feditest.reporting import error, trace, warning
 from feditest.utils import FEDITEST_VERSION
 
 
+# Reused for every save, instead of setting up a new encoder each time
+_REGISTRY_ENCODER = msgspec.json.Encoder()
+
+
+def _load_private_key(pem: str) -> rsa.RSAPrivateKey:
+    """
+    Parse a PEM-format private key.
+    """
+    return cast(rsa.RSAPrivateKey, load_pem_private_key(pem.encode('utf-8'), password=None))
+
+
+@lru_cache(maxsize=1)
+def _load_ca_private_key(pem: str) -> rsa.RSAPrivateKey:
+    """
+    Parse the PEM-format private key of the CA. It signs every host certificate, so we remember the
+    parsed key. Keyed by the PEM string, so a replaced key is never returned.
+    """
+    return _load_private_key(pem)
+
+
+@lru_cache(maxsize=1)
+def _load_ca_certificate(pem: str) -> x509.Certificate:
+    """
+    Same as _load_ca_private_key, but for the CA certificate.
+    """
+    return x509.load_pem_x509_certificate(pem.encode('utf-8'))
+
+
 class RegistryRoot(msgspec.Struct):
     """
     What we know about the root certificate of the CA
@@ -84,8 +113,8 @@ class Registry(msgspec.Struct):
 
 
     def as_json(self) -> bytes:
-        ret = msgspec.json.encode(self)
-        ret = msgspec.json.format(ret, indent=4)
+        ret = _REGISTRY_ENCODER.encode(self)
+        ret = msgspec.json.format(ret, indent=4) # the encoder can't indent by itself
         return ret
 
 
@@ -101,7 +130,7 @@ class Registry(msgspec.Struct):
 
 
     def obtain_registry_root(self) -> RegistryRoot:
-        ca_key: rsa.RSAPrivateKey
+        ca_key: rsa.RSAPrivateKey | None = None # only set if we generate it here
         if not self.ca.key:
             self.ca.cert = None # That is now invalid, too
             ca_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
@@ -116,7 +145,8 @@ class Registry(msgspec.Struct):
             ])
             if self.ca.key is None:
                 raise Exception("No key for CA")
-            ca_key = cast(rsa.RSAPrivateKey, load_pem_private_key(self.ca.key.encode('utf-8'), password=None))
+            if ca_key is None:
+                ca_key = _load_ca_private_key(self.ca.key)
             now = datetime.now(UTC)
             ca_cert = x509.CertificateBuilder().subject_name(ca_subject
                 ).issuer_name(ca_subject
@@ -154,9 +184,11 @@ class Registry(msgspec.Struct):
         else:
             safe_appname = 'other'
 
+        # Compile once for all hosts; escape the domain so its periods don't match any character
+        host_regex = re.compile(f'{ re.escape(safe_appname) }-(\\d+)\\.{ re.escape(self.ca.domain) }')
         current = 0
         for host in self.hosts:
-            if m := re.search(f'^{ safe_appname }-(\\d+)\\.{ self.ca.domain }$', host):
+            if m := host_regex.fullmatch(host):
                 index = int(m.group(1))
                 current = max(current, index)
 
@@ -173,7 +205,7 @@ class Registry(msgspec.Struct):
             ret = RegistryHostInfo(host=host)
             self.hosts[host] = ret
 
-        host_key: rsa.RSAPrivateKey
+        host_key: rsa.RSAPrivateKey | None = None # only set if we generate it here
         if ret.key is None:
             ret.cert = None # That is now invalid, too
             host_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
@@ -184,10 +216,11 @@ class Registry(msgspec.Struct):
 
         if ret.cert is None:
             self.obtain_registry_root() # make sure we have it
-            ca_cert = x509.load_pem_x509_certificate(cast(str,self.ca.cert).encode('utf-8'))
-            ca_key = cast(rsa.RSAPrivateKey, load_pem_private_key(cast(str,self.ca.key).encode('utf-8'), password=None))
+            ca_cert = _load_ca_certificate(cast(str,self.ca.cert))
+            ca_key = _load_ca_private_key(cast(str,self.ca.key))
 
-            host_key =  cast(rsa.RSAPrivateKey, load_pem_private_key(ret.key.encode('utf-8'), password=None))
+            if host_key is None:
+                host_key = _load_private_key(ret.key) # each host key is only used once, so not worth caching
             host_subject = x509.Name([
                 x509.NameAttribute(x509.NameOID.COMMON_NAME, host),
             ])
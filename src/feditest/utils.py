@@ -3,6 +3,7 @@ Utility functions
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import glob
 import importlib.util
 import pkgutil
@@ -11,8 +12,9 @@ import sys
 import importlib.metadata
 from types import ModuleType
 from typing import Any, Callable, List, Optional, TypeVar
-from urllib.parse import ParseResult, parse_qs, urlparse
+from urllib.parse import ParseResult, parse_qsl, urlparse
 from langcodes import Language
+from langcodes.tag_parser import LanguageTagError
 
 from feditest.reporting import warning
 
@@ -28,9 +30,14 @@ FEDITEST_VERSION = _version('feditest')
 ACCT_REGEX = re.compile(r"acct:([-a-zA-Z0-9\._~][-a-zA-Z0-9\._~!$&'\(\)\*\+,;=%]*)@([-a-zA-Z0-9\.:]+)")
 SSH_REGEX = re.compile(r"ssh://([-a-z-A-Z0-9\._~!$&'\(\)\*\+,;=%:]+@)?([-a-zA-Z0-9\.:]+)(:[0-9]+)?")
 EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+$")
+# Anything that does not start like this cannot be a valid HTTP, HTTPS or ACCT URI
+HTTP_HTTPS_ACCT_PREFIX_REGEX = re.compile(r"acct:|https?://", re.IGNORECASE)
 
 T = TypeVar("T")
 
+# Shared by all ParsedNonAcctUris without a query; never modified
+_NO_QUERY_PARAMS : dict[str,str | list[str]] = {}
+
 
 class ParsedUri(ABC):
     """
@@ -38,10 +45,14 @@ class ParsedUri(ABC):
     and so we don't use ParseResult. Also failed attempting to inherit from it.
     Because the structure is so different, we have subtypes.
     """
+    __slots__ = ()
+
     @staticmethod
+    @lru_cache(maxsize=1024)
     def parse(url: str, scheme='', allow_fragments=True) -> Optional['ParsedUri']:
         """
         The equivalent of urlparse(str)
+        ParsedUris are not modified once created, so the same URL returns the same, shared instance.
         """
         parsed : ParseResult = urlparse(url, scheme, allow_fragments)
         if parsed.scheme == 'acct':
@@ -71,14 +82,18 @@ class ParsedNonAcctUri(ParsedUri):
     """
     ParsedUris that are "normal" URIs such as http URIs.
     """
+    __slots__ = ('_fragment', '_netloc', '_params', '_path', '_query', '_query_params', '_scheme', '_uri')
+    _CACHE_SLOTS = ('_query_params', '_uri') # derived from the other slots on first use, not part of the value
+
     def __init__(self, scheme: str, netloc: str, path: str, params: str, query: str, fragment: str):
-        self._scheme = scheme
-        self._netloc = netloc
+        self._scheme = sys.intern(scheme)
+        self._netloc = sys.intern(netloc)
         self._path = path
         self._params = params
         self._query = query
         self._fragment = fragment
-        self._query_params : dict[str,list[str]] | None = None
+        self._query_params : dict[str,str | list[str]] | None = None # single value unless there are several
+        self._uri : str | None = None # assembled on first use
 
 
     # Python 3.12 @override
@@ -115,17 +130,21 @@ class ParsedNonAcctUri(ParsedUri):
     # Python 3.12 @override
     @property
     def uri(self) -> str:
-        ret = f'{ self._scheme }:'
+        if self._uri is not None:
+            return self._uri
+
+        parts = [ self._scheme, ':' ]
         if self._netloc:
-            ret += f'//{ self._netloc}'
-        ret += self._path
+            parts += ( '//', self._netloc )
+        parts.append(self._path)
         if self._params:
-            ret += f';{ self._params}'
+            parts += ( ';', self._params )
         if self._query:
-            ret += f'?{ self._query }'
+            parts += ( '?', self._query )
         if self._fragment:
-            ret += f'#{ self._fragment }'
-        return ret
+            parts += ( '#', self._fragment )
+        self._uri = ''.join(parts)
+        return self._uri
 
 
     def has_query_param(self, name: str) -> bool:
@@ -139,19 +158,20 @@ class ParsedNonAcctUri(ParsedUri):
         self._parse_query_params()
         if self._query_params:
             found = self._query_params.get(name)
-            if found:
-                match len(found):
-                    case 1:
-                        return found[0]
-                    case _:
-                        raise RuntimeError(f'Query has {len(found)} values for query parameter {name}')
+            if isinstance(found, list):
+                raise RuntimeError(f'Query has {len(found)} values for query parameter {name}')
+            return found
         return None
 
 
     def query_param_mult(self, name: str) -> List[str] | None:
         self._parse_query_params()
         if self._query_params:
-            return self._query_params.get(name)
+            found = self._query_params.get(name)
+            if isinstance(found, str):
+                return [ found ]
+            if found is not None:
+                return list(found) # a copy: ParsedUris are shared, so callers must not modify ours
         return None
 
 
@@ -161,21 +181,36 @@ class ParsedNonAcctUri(ParsedUri):
 
 
     def _parse_query_params(self):
-        if self._query_params:
-            return
+        if self._query_params is not None:
+            return # already parsed, possibly to nothing
         if self._query:
-            self._query_params = parse_qs(self.query)
+            # Like parse_qs, but without allocating a list for the common case of a single value
+            query_params : dict[str,str | list[str]] = {}
+            for name, value in parse_qsl(self._query):
+                found = query_params.get(name)
+                if found is None:
+                    query_params[name] = value
+                elif isinstance(found, list):
+                    found.append(value)
+                else:
+                    query_params[name] = [ found, value ]
+            # Assign only once complete: this ParsedUri may be shared with other threads
+            self._query_params = query_params
         else:
-            self._query_params = {}
+            self._query_params = _NO_QUERY_PARAMS
 
 
 class ParsedAcctUri(ParsedUri):
     """
     ParsedUris that are acct: URIs
     """
+    __slots__ = ('_host', '_uri', '_user')
+    _CACHE_SLOTS = ('_uri',) # derived from the other slots on first use, not part of the value
+
     def __init__(self, user: str, host: str):
         self._user = user
-        self._host = host
+        self._host = sys.intern(host)
+        self._uri : str | None = None # assembled on first use
 
 
     # Python 3.12 @override
@@ -197,7 +232,9 @@ class ParsedAcctUri(ParsedUri):
     # Python 3.12 @override
     @property
     def uri(self) -> str:
-        return f'acct:{ self.user }@{ self.host }'
+        if self._uri is None:
+            self._uri = f'acct:{ self._user }@{ self._host }'
+        return self._uri
 
 
     # Python 3.12 @override
@@ -367,6 +404,9 @@ def http_https_acct_uri_parse_validate(candidate: str) -> ParsedUri | None:
     Validate that the provided string is a valid HTTP, HTTPS or ACCT URI.
     return: ParsedUri if valid, None otherwise
     """
+    if not HTTP_HTTPS_ACCT_PREFIX_REGEX.match(candidate):
+        # e.g. registered link relation types in JRDs: no need to parse
+        return None
     parsed = ParsedUri.parse(candidate)
     if isinstance(parsed,ParsedNonAcctUri):
         if parsed.scheme in ['http', 'https'] and len(parsed.netloc) > 0:
@@ -421,8 +461,11 @@ def rfc5646_language_tag_parse_validate(candidate: str) -> str | None:
     Validate a language tag according to RFC 5646, see https://www.rfc-editor.org/rfc/rfc5646.html
     return: string if valid, None otherwise
     """
-    if Language.get(candidate).is_valid(): # FIXME needs checking that this library actually does what it says it does
-        return candidate
+    try:
+        if Language.get(candidate).is_valid(): # FIXME needs checking that this library actually does what it says it does
+            return candidate
+    except LanguageTagError:
+        pass # not even syntactically a language tag
     return None
 
 
@@ -0,0 +1,165 @@
+"""
+Test parsing and validation of JRDs.
+"""
+
+import json
+
+import msgspec
+import pytest
+
+from feditest.protocols.webfinger.diag import ClaimedJrd
+
+
+VALID_JRD = {
+    'subject': 'acct:joe@example.com',
+    'aliases': [ 'https://example.com/@joe' ],
+    'properties': {
+        'http://example.com/ns/role': 'user'
+    },
+    'links': [
+        {
+            'rel': 'self',
+            'type': 'application/activity+json',
+            'href': 'https://example.com/users/joe'
+        },
+        {
+            'rel': 'http://webfinger.net/rel/profile-page',
+            'type': 'text/html',
+            'href': 'https://example.com/@joe'
+        }
+    ]
+}
+
+
+def test_valid():
+    jrd = ClaimedJrd.create_and_validate(json.dumps(VALID_JRD))
+    assert jrd.subject() == 'acct:joe@example.com'
+    assert jrd.aliases() == [ 'https://example.com/@joe' ]
+    assert len(jrd.links()) == 2
+
+
+def test_not_an_object():
+    with pytest.raises(ClaimedJrd.InvalidTypeError):
+        ClaimedJrd.create_and_validate('[]')
+
+
+def test_invalid_subject():
+    with pytest.raises(ClaimedJrd.InvalidUriError):
+        ClaimedJrd.create_and_validate(json.dumps({ 'subject': 'not a uri' }))
+
+
+def test_multiple_errors():
+    with pytest.raises(ExceptionGroup) as excinfo:
+        ClaimedJrd.create_and_validate(json.dumps({
+            'subject': 7,
+            'links': [
+                'not a link',
+                { 'rel': 'not-registered' }
+            ]
+        }))
+    assert [ type(exc) for exc in excinfo.value.exceptions ] == [
+        ClaimedJrd.InvalidTypeError,
+        ClaimedJrd.InvalidTypeError,
+        ClaimedJrd.InvalidRelError
+    ]
+
+
+def test_not_json():
+    with pytest.raises(msgspec.DecodeError):
+        ClaimedJrd.create_and_validate('{ "subject": ')
+
+
+def test_as_json_string():
+    jrd = ClaimedJrd(json.dumps(VALID_JRD))
+    assert json.loads(jrd.as_json_string()) == VALID_JRD
+    assert jrd.as_json_string() is jrd.as_json_string()
+    assert str(jrd) == jrd.as_json_string()
+
+
+def test_link_subset():
+    full = ClaimedJrd(json.dumps(VALID_JRD))
+    self_only = ClaimedJrd(json.dumps({ **VALID_JRD, 'links': VALID_JRD['links'][:1] }))
+    profile_only = ClaimedJrd(json.dumps({ **VALID_JRD, 'links': VALID_JRD['links'][1:] }))
+    reversed_links = ClaimedJrd(json.dumps({ **VALID_JRD, 'links': VALID_JRD['links'][::-1] }))
+
+    assert full.is_valid_link_subset(full)
+    assert self_only.is_valid_link_subset(full, [ 'self' ])
+    assert not self_only.is_valid_link_subset(full, [ 'self', 'http://webfinger.net/rel/profile-page' ])
+    assert not profile_only.is_valid_link_subset(full, [ 'self' ])
+    assert not full.is_valid_link_subset(self_only)
+    assert not reversed_links.is_valid_link_subset(full)
+
+    invalid_rel = ClaimedJrd(json.dumps({ 'links': [ { 'rel': [ 'x' ] }, { 'rel': 'self' } ] }))
+    self_link_only = ClaimedJrd(json.dumps({ 'links': [ { 'rel': 'self' } ] }))
+    assert self_link_only.is_valid_link_subset(invalid_rel, [ 'self' ])
+
+    not_a_link = ClaimedJrd(json.dumps({ 'links': [ 'junk', { 'rel': 'self' } ] }))
+    assert self_link_only.is_valid_link_subset(not_a_link, [ 'self' ])
+
+    for links in [ 7, { 'rel': 'self' } ]:
+        not_links = ClaimedJrd(json.dumps({ 'links': links }))
+        assert not self_link_only.is_valid_link_subset(not_links, [ 'self' ])
+        assert not not_links.is_valid_link_subset(self_link_only, [ 'self' ])
+
+
+def test_is_valid():
+    assert ClaimedJrd.is_valid(json.dumps(VALID_JRD))
+    assert not ClaimedJrd.is_valid('[]')
+    assert not ClaimedJrd.is_valid('{ "subject": ')
+    assert not ClaimedJrd.is_valid(json.dumps({ 'subject': 'not a uri', 'aliases': 'not a list' }))
+
+
+def test_stop_at_first_error():
+    jrd = ClaimedJrd(json.dumps({ 'subject': 'not a uri', 'aliases': 'not a list' }))
+    with pytest.raises(ClaimedJrd.InvalidUriError):
+        jrd.validate(stop_at_first_error=True)
+
+
+def test_link_titles():
+    titles_jrd = { 'links': [ { 'rel': 'self', 'titles': { 'en-US': 'Joe', 'und': 'Joe' } } ] }
+    ClaimedJrd.create_and_validate(json.dumps(titles_jrd))
+
+    titles_jrd['links'][0]['titles'] = { 'en-US': 'Joe', 'not a language tag': 'Joe' }
+    with pytest.raises(ClaimedJrd.InvalidLanguageTagError):
+        ClaimedJrd.create_and_validate(json.dumps(titles_jrd))
+
+
+def test_media_types():
+    for media_type in [ 'text/html', 'application/activity+json', 'application/ld+json; profile="https://www.w3.org/ns/activitystreams"' ]:
+        assert ClaimedJrd.is_valid_media_type(media_type), media_type
+    for media_type in [ '', 'text', 'a/', '/b', 'a/b/c', 'text/html extra', '+a/b' ]:
+        assert not ClaimedJrd.is_valid_media_type(media_type), media_type
+
+
+def test_optional_members_missing():
+    jrd = ClaimedJrd(json.dumps({ 'subject': 'acct:joe@example.com' }))
+    assert jrd.aliases() is None
+    assert jrd.properties() is None
+    assert jrd.links() is None
+
+
+def test_validate_twice():
+    jrd = ClaimedJrd(json.dumps({ 'subject': 'not a uri', 'aliases': 'not a list' }))
+    with pytest.raises(ExceptionGroup) as first:
+        jrd.validate()
+    with pytest.raises(ExceptionGroup) as second:
+        jrd.validate()
+    assert first.value is not second.value
+    assert [ str(exc) for exc in first.value.exceptions ] == [ str(exc) for exc in second.value.exceptions ]
+    assert not set(map(id, first.value.exceptions)) & set(map(id, second.value.exceptions))
+    with pytest.raises(ClaimedJrd.InvalidUriError):
+        jrd.validate(stop_at_first_error=True)
+
+    valid = ClaimedJrd(json.dumps(VALID_JRD))
+    valid.validate(stop_at_first_error=True)
+    valid.validate()
+
+
+def test_link_properties():
+    jrd = ClaimedJrd(json.dumps({ 'links': [ { 'rel': 'self', 'properties': { 'not-a-uri': 1 } } ] }))
+    with pytest.raises(ExceptionGroup) as e:
+        jrd.validate()
+    assert [ str(exc) for exc in e.value.exceptions ] == [
+        'Link property name not absolute URI: "not-a-uri"',
+        'Link property value not a string nor null. Key "not-a-uri"'
+    ]
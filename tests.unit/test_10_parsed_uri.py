@@ -0,0 +1,68 @@
+"""
+Test ParsedUri and its subtypes.
+"""
+
+import pytest
+
+from feditest.utils import ParsedAcctUri, ParsedNonAcctUri, ParsedUri, http_https_acct_uri_parse_validate
+
+
+def test_parse_https():
+    parsed = ParsedUri.parse('https://example.com/foo;bar?a=b#frag')
+    assert isinstance(parsed, ParsedNonAcctUri)
+    assert parsed.scheme == 'https'
+    assert parsed.netloc == 'example.com'
+    assert parsed.path == '/foo'
+    assert parsed.params == 'bar'
+    assert parsed.query == 'a=b'
+    assert parsed.fragment == 'frag'
+    assert parsed.uri == 'https://example.com/foo;bar?a=b#frag'
+
+
+def test_parse_acct():
+    parsed = ParsedUri.parse('acct:joe@example.com')
+    assert isinstance(parsed, ParsedAcctUri)
+    assert parsed.user == 'joe'
+    assert parsed.host == 'example.com'
+    assert parsed.uri == 'acct:joe@example.com'
+
+
+def test_parse_invalid():
+    assert ParsedUri.parse('no-scheme') is None
+    assert ParsedUri.parse('https:no-netloc') is None
+
+
+def test_query_params():
+    parsed = ParsedUri.parse('https://example.com/?single=1&mult=2&mult=3')
+    assert isinstance(parsed, ParsedNonAcctUri)
+
+    assert parsed.has_query_param('single')
+    assert parsed.has_query_param('mult')
+    assert not parsed.has_query_param('other')
+
+    assert parsed.query_param_single('single') == '1'
+    assert parsed.query_param_single('other') is None
+    with pytest.raises(RuntimeError):
+        parsed.query_param_single('mult')
+
+    assert parsed.query_param_mult('single') == [ '1' ]
+    assert parsed.query_param_mult('mult') == [ '2', '3' ]
+    assert parsed.query_param_mult('other') is None
+
+
+def test_query_params_not_shared():
+    uri = 'https://example.com/?mult=1&mult=2'
+    mult = ParsedUri.parse(uri).query_param_mult('mult')
+    mult.append('x')
+
+    assert ParsedUri.parse(uri).query_param_mult('mult') == [ '1', '2' ]
+
+
+def test_http_https_acct_uri_parse_validate():
+    assert http_https_acct_uri_parse_validate('acct:joe@example.com')
+    assert http_https_acct_uri_parse_validate('https://example.com/joe')
+    assert http_https_acct_uri_parse_validate('HTTP://example.com/')
+    assert http_https_acct_uri_parse_validate('self') is None
+    assert http_https_acct_uri_parse_validate('mailto:joe@example.com') is None
+    assert http_https_acct_uri_parse_validate('https:/example.com') is None
+    assert http_https_acct_uri_parse_validate('acct:joe') is None
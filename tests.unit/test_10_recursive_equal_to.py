@@ -0,0 +1,43 @@
+"""
+Test the recursive equality matcher.
+"""
+
+import json
+
+from hamcrest import assert_that, is_not
+
+from feditest.protocols.webfinger.diag import ClaimedJrd
+from feditest.protocols.webfinger.utils import recursive_equal_to
+from feditest.utils import ParsedUri
+
+
+def test_equal():
+    shared = { 'a': [ 1, 2.0, 'three', True ] }
+    assert_that({ 'x': shared, 'y': None }, recursive_equal_to({ 'x': shared, 'y': None }))
+    assert_that({ 'x': shared }, recursive_equal_to({ 'x': { 'a': [ 1, 2.0, 'three', True ] } }))
+
+
+def test_not_equal():
+    assert_that({ 'x': None }, is_not(recursive_equal_to({ 'x': 1 })))
+    assert_that({ 'x': 1 }, is_not(recursive_equal_to({ 'x': None })))
+    assert_that([ 1 ], is_not(recursive_equal_to([ 1.0 ])))
+    assert_that({ 'x': [ 1, 2 ] }, is_not(recursive_equal_to({ 'x': [ 1, 3 ] })))
+
+
+def test_filled_caches_are_ignored():
+    jrd_json = json.dumps({ 'subject': 'acct:joe@example.com', 'links': [ { 'rel': 'self' } ] })
+    validated = ClaimedJrd(jrd_json)
+    validated.validate()
+    str(validated)
+    assert_that(validated, recursive_equal_to(ClaimedJrd(jrd_json)))
+    assert_that(ClaimedJrd(jrd_json), recursive_equal_to(validated))
+
+    for uri in [ 'https://example.com/?a=1', 'acct:joe@example.com' ]:
+        used = ParsedUri.parse(uri)
+        assert used is not None
+        assert used.uri == uri
+        fresh = ParsedUri.parse.__wrapped__(uri) # bypass the parse cache, so we get a separate instance
+        assert_that(used, recursive_equal_to(fresh))
+        assert_that(fresh, recursive_equal_to(used))
+
+    assert_that(ClaimedJrd(jrd_json), is_not(recursive_equal_to(ClaimedJrd(json.dumps({ 'subject': 'acct:jane@example.com' })))))
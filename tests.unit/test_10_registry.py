@@ -4,6 +4,8 @@ Test the UBOS host registry / CA
 
 import tempfile
 
+from cryptography import x509
+
 from feditest.registry import Registry
 
 
@@ -50,6 +52,18 @@ def test_new_hosts():
     assert h4.endswith('.' + D)
 
 
+def test_new_hosts_sequential():
+    D = 'something.example'
+    r = Registry.create( D )
+
+    assert r.obtain_new_hostname('foo') == 'foo-1.' + D
+    assert r.obtain_new_hostname('foo') == 'foo-2.' + D
+    assert r.obtain_new_hostname('bar') == 'bar-1.' + D
+
+    r.obtain_hostinfo('foo-7.somethingXexample') # not in our domain
+    assert r.obtain_new_hostname('foo') == 'foo-3.' + D
+
+
 def test_new_host_and_cert():
     D = 'something.example'
     r = Registry.create( D )
@@ -64,6 +78,18 @@ def test_new_host_and_cert():
     assert isinstance(h1info.cert, str)
 
 
+def test_host_certs_signed_by_root():
+    D = 'something.example'
+    r = Registry.create( D )
+
+    root_cert = x509.load_pem_x509_certificate(r.obtain_registry_root().cert.encode('utf-8'))
+    for i in range(3):
+        hostinfo = r.obtain_new_hostinfo('foo')
+        host_cert = x509.load_pem_x509_certificate(hostinfo.cert.encode('utf-8'))
+        host_cert.verify_directly_issued_by(root_cert)
+        assert host_cert.subject.rfc4514_string() == f'CN=foo-{ i+1 }.{ D }'
+
+
 def test_save_restore():
     D = 'something.example'
     r1 = Registry.create( D )
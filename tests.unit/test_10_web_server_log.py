@@ -0,0 +1,91 @@
+"""
+Test the WebServerLog and the HTTP request/response data it holds.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from multidict import MultiDict
+
+from feditest.protocols.web.diag import HttpRequest, HttpRequestResponsePair, HttpResponse, WebServerLog
+from feditest.utils import ParsedUri
+
+
+def _pair(when_started: datetime) -> HttpRequestResponsePair:
+    request = HttpRequest(ParsedUri.parse('https://example.com/'), when_started=when_started)
+    return HttpRequestResponsePair(request, request, HttpResponse(200, MultiDict()))
+
+
+def test_when_started_defaults_to_now():
+    before = datetime.now(UTC)
+    request = HttpRequest(ParsedUri.parse('https://example.com/'))
+    after = datetime.now(UTC)
+
+    assert before <= request.when_started <= after
+
+
+def test_entries_since():
+    now = datetime.now(UTC)
+    log = WebServerLog(now)
+    entries = [ _pair(now + timedelta(seconds=i)) for i in range(5) ]
+    for entry in entries:
+        log.append(entry)
+
+    assert log.entries_since(now).entries() == entries
+    assert log.entries_since(now + timedelta(seconds=2)).entries() == entries[2:]
+    assert log.entries_since(now + timedelta(seconds=1.5)).entries() == entries[2:]
+    assert log.entries_since(now + timedelta(seconds=10)).entries() == []
+
+
+def test_is_redirect():
+    for status in [ 301, 302, 303, 307, 308 ]:
+        assert HttpResponse(status, MultiDict()).is_redirect()
+    for status in [ 0, 200, 300, 304, 404, 599, 600, 999 ]:
+        assert not HttpResponse(status, MultiDict()).is_redirect()
+
+
+def test_header_names_lowercased():
+    response = HttpResponse(302, MultiDict([ ( 'Content-Type', 'text/plain; charset=utf-8' ), ( 'LOCATION', 'https://example.com/' ) ]), b'Moved')
+
+    assert 'content-type' in response.response_headers
+    assert response.content_type() == 'text/plain; charset=utf-8'
+    assert response.payload_charset() == 'utf-8'
+    assert response.location() == 'https://example.com/'
+    assert response.payload_as_string() == 'Moved'
+
+
+def test_payload_charset():
+    def charset(content_type: str) -> str | None:
+        return HttpResponse(200, MultiDict([ ( 'content-type', content_type ) ])).payload_charset()
+
+    assert charset('application/jrd+json') is None
+    assert charset('application/jrd+json; charset=utf-8') == 'utf-8'
+    assert charset('application/jrd+json;charset=UTF-8') == 'UTF-8'
+    assert charset('text/html; Charset="iso-8859-1"') == 'iso-8859-1'
+    assert charset('text/html; charset=utf-8; foo=bar') == 'utf-8'
+
+
+def test_entries_since_is_snapshot():
+    now = datetime.now(UTC)
+    log = WebServerLog(now)
+    early = _pair(now - timedelta(seconds=5))
+    late = _pair(now + timedelta(seconds=1))
+    log.append(early)
+    log.append(late)
+
+    since = log.entries_since(now - timedelta(seconds=1))
+    assert since.entries() == [ late ]
+
+    log.append(_pair(now + timedelta(seconds=2)))
+    assert since.entries() == [ late ]
+
+
+def test_entries_appended_out_of_order():
+    now = datetime.now(UTC)
+    log = WebServerLog(now)
+    entries = [ _pair(now + timedelta(seconds=i)) for i in range(5) ]
+    for i in [ 3, 0, 4, 1, 2 ]:
+        log.append(entries[i])
+
+    assert log.entries() == entries
+    assert log.entries_since(now + timedelta(seconds=2)).entries() == entries[2:]
+    assert WebServerLog(now, entries[::-1]).entries() == entries
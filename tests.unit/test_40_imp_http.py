@@ -0,0 +1,58 @@
+"""
+Test that the Imp's HTTP requests don't carry state from one request to the next.
+"""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from typing import Iterator
+
+import pytest
+
+from feditest.nodedrivers import NodeConfiguration
+from feditest.nodedrivers.imp import Imp, ImpInProcessNodeDriver
+
+
+class CookieSettingHandler(BaseHTTPRequestHandler):
+    """
+    Sets a cookie on every response, redirects from /redirect to /, and remembers the Cookie headers it received.
+    """
+    received_cookies : list[str | None] = []
+
+    def do_GET(self):
+        CookieSettingHandler.received_cookies.append(self.headers.get('Cookie'))
+        if self.path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/')
+        else:
+            self.send_response(200)
+        self.send_header('Set-Cookie', 'session=abc; Path=/')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+    def log_message(self, *args): # keep the test output clean
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[HTTPServer]:
+    CookieSettingHandler.received_cookies = []
+    ret = HTTPServer(('127.0.0.1', 0), CookieSettingHandler)
+    thread = Thread(target=ret.serve_forever, daemon=True)
+    thread.start()
+    yield ret
+    ret.shutdown()
+    ret.server_close()
+
+
+def test_cookies_not_sent_back(server: HTTPServer):
+    imp = Imp('client', NodeConfiguration(ImpInProcessNodeDriver(), 'Imp'))
+    base = f'http://127.0.0.1:{ server.server_address[1] }'
+    try:
+        imp.http_get(base + '/')
+        imp.http_get(base + '/redirect', follow_redirects=True)
+        imp.http_get(base + '/')
+    finally:
+        imp.close_http_clients()
+
+    assert CookieSettingHandler.received_cookies == [ None, None, None, None ]
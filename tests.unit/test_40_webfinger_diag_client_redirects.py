@@ -0,0 +1,104 @@
+"""
+Test that the WebFinger diag client follows redirects itself, gives up eventually, reports errors, and can run queries in batches.
+"""
+
+import json
+
+from multidict import MultiDict
+
+from feditest.nodedrivers import NodeConfiguration
+from feditest.nodedrivers.imp import ImpInProcessNodeDriver
+from feditest.protocols.web.diag import HttpRequest, HttpRequestResponsePair, HttpResponse, WebDiagClient
+from feditest.protocols.webfinger.abstract import AbstractWebFingerDiagClient
+from feditest.protocols.webfinger.diag import WebFingerDiagClient
+
+
+JRD_PAYLOAD = json.dumps({ 'subject': 'acct:joe@example.com' }).encode('utf-8')
+
+
+class RedirectingWebFingerDiagClient(AbstractWebFingerDiagClient):
+    """
+    Instead of making HTTP requests, hands out redirects until it runs out of them.
+    """
+    def __init__(self, redirects: list[str], final_response: HttpResponse | None = None):
+        super().__init__('client', NodeConfiguration(ImpInProcessNodeDriver(), 'Imp'))
+        self.redirects = list(redirects)
+        self.final_response = final_response
+        self.requests : list[HttpRequest] = []
+
+
+    # Python 3.12 @override
+    def http(self, request: HttpRequest, follow_redirects: bool = True, verify=False) -> HttpRequestResponsePair:
+        assert not follow_redirects
+        self.requests.append(request)
+        if self.redirects:
+            response = HttpResponse(302, MultiDict({ 'Location': self.redirects.pop(0) }))
+        elif self.final_response:
+            response = self.final_response
+        else:
+            response = HttpResponse(200, MultiDict({ 'Content-Type': 'application/jrd+json' }), JRD_PAYLOAD)
+        return HttpRequestResponsePair(request, request, response)
+
+
+def test_no_redirect():
+    client = RedirectingWebFingerDiagClient([])
+    result = client.diag_perform_webfinger_query('acct:joe@example.com')
+    assert len(client.requests) == 1
+    assert result.http_request_response_pair.final_request is result.http_request_response_pair.request
+    assert not result.exceptions
+
+
+def test_redirects_followed():
+    client = RedirectingWebFingerDiagClient([ 'https://other.example/wf', '/wf2' ])
+    result = client.diag_perform_webfinger_query('acct:joe@example.com')
+    assert [ request.parsed_uri.uri for request in client.requests[1:] ] == [ 'https://other.example/wf', 'https://other.example/wf2' ]
+    assert result.http_request_response_pair.request is client.requests[0]
+    assert result.http_request_response_pair.final_request is client.requests[-1]
+    assert not result.exceptions
+
+
+def test_too_many_redirects():
+    client = RedirectingWebFingerDiagClient([ f'https://example.com/wf{ i }' for i in range(20) ])
+    result = client.diag_perform_webfinger_query('acct:joe@example.com')
+    assert len(client.requests) == 11
+    assert len(result.exceptions) == 1
+    assert isinstance(result.exceptions[0], WebDiagClient.TooManyRedirectsError)
+    assert str(result.exceptions[0]).startswith('Too many redirects: https://example.com/.well-known/webfinger')
+
+
+def test_not_found_is_not_parsed():
+    client = RedirectingWebFingerDiagClient([], HttpResponse(404, MultiDict({ 'Content-Type': 'text/html' }), b'<html>Not found</html>'))
+    result = client.diag_perform_webfinger_query('acct:joe@example.com')
+    assert result.jrd is None
+    assert [ type(exc) for exc in result.exceptions ] == [ WebFingerDiagClient.WrongHttpStatusError, WebFingerDiagClient.WrongContentTypeError ]
+
+
+def test_batch_queries():
+    client = RedirectingWebFingerDiagClient([])
+    resources = [ ( f'acct:joe{ i }@example.com', None ) for i in range(40) ]
+    results = client.diag_perform_webfinger_queries(resources)
+    assert len(client.requests) == 40
+    assert [ result.http_request_response_pair.request.parsed_uri.uri for result in results ] == [
+        f'https://example.com/.well-known/webfinger?resource=acct%3Ajoe{ i }%40example.com' for i in range(40)
+    ]
+
+
+def test_content_type_with_parameters():
+    for content_type, ok in [
+        ( 'application/jrd+json', True ),
+        ( 'application/jrd+json; charset=utf-8', True ),
+        ( 'application/jrd+jsonx', False ),
+        ( 'application/json', False )
+    ]:
+        client = RedirectingWebFingerDiagClient([], HttpResponse(200, MultiDict({ 'Content-Type': content_type }), JRD_PAYLOAD))
+        result = client.diag_perform_webfinger_query('acct:joe@example.com')
+        assert bool(result.exceptions_of_type(WebFingerDiagClient.WrongContentTypeError)) != ok, content_type
+
+
+def test_payload_charset():
+    payload = json.dumps({ 'subject': 'acct:jürgen@example.com' }, ensure_ascii=False)
+    for charset in [ 'utf-8', 'UTF-8', 'iso-8859-1' ]:
+        client = RedirectingWebFingerDiagClient([], HttpResponse(200, MultiDict({ 'Content-Type': f'application/jrd+json; charset={ charset }' }), payload.encode(charset)))
+        result = client.diag_perform_webfinger_query('acct:joe@example.com')
+        assert result.jrd is not None
+        assert result.jrd.subject() == 'acct:jürgen@example.com', charset